@@ -1,15 +1,203 @@
 import asyncio
+import json
+import logging
 import re
 import sys
 import os
+import shutil
 import pandas as pd
-from playwright.async_api import Page, async_playwright, expect, TimeoutError
-from datetime import datetime, timedelta, date
+import xlsxwriter
+from functools import lru_cache
+from playwright.async_api import Page, Route, async_playwright, expect, TimeoutError
+from datetime import datetime, timedelta, date, time
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional, and is not available on Windows.
+    uvloop = None
+
+# Progress and diagnostic messages go through this logger, configured in main(). At
+# the default WARNING level the per-step INFO messages are never even formatted.
+log = logging.getLogger(__name__)
+
+# ==============================================================================
+# --- PAGE SELECTORS ---
+# ==============================================================================
+
+# CSS selectors used inside the scraping loops. Keeping them in one place means
+# each selector string is built once and shared by every scroll pass.
+ORDER_CARD_SELECTOR = 'div.tw-flex.tw-flex-col:has(span.icon-right-arrow)'
+ORDER_CARD_CONTAINER_SELECTOR = 'div.tw-flex.tw-flex-col'
+ORDER_STATUS_SELECTOR = 'div.tw-text-500'
+ITEM_ROW_SELECTOR = "div.tw-flex-row:has(img):has(div.tw-text-300.tw-font-medium)"
+ITEM_NAME_SELECTOR = "div.tw-text-300.tw-font-medium"
+ITEM_QUANTITY_SELECTOR = "div.tw-text-200.tw-font-regular"
+ITEM_PRICE_SELECTOR = "div.tw-text-200.tw-font-bold"
+BILL_ROW_SELECTOR = "div.tw-flex.tw-w-full.tw-flex-row"
+ITEM_COUNT_SELECTOR = "div.tw-text-400.tw-font-bold"
+
+# Maps each bill field scraped from an order's details page to its on-page label.
+BILL_FIELD_LABELS = {
+    'mrp': 'MRP', 'product_discount': 'Product discount', 'item_total': 'Item total',
+    'handling_charge': 'Handling charge', 'delivery_charges': 'Delivery charges', 'bill_total': 'Bill total',
+}
+
+# Builds a {label: value} map of the bill block in a single browser round-trip. A
+# row's label is the first of its divs whose text is exactly one of the wanted
+# labels, and its value is the row's last div. Later (more deeply nested) rows
+# win if a label appears more than once.
+EXTRACT_BILL_JS = """([rowSelector, labels]) => {
+    const values = {};
+    for (const row of document.querySelectorAll(rowSelector)) {
+        const divs = Array.from(row.querySelectorAll('div'));
+        const label = divs.map(div => div.innerText.trim()).find(text => labels.includes(text));
+        if (label) values[label] = divs[divs.length - 1].innerText;
+    }
+    return values;
+}"""
+
+# Reads every field of every rendered item row in a single browser round-trip.
+# Missing fields come back as null so the Python side can skip incomplete rows.
+EXTRACT_ITEMS_JS = """(rows, selectors) => rows.map(row => {
+    const text = selector => row.querySelector(selector)?.innerText ?? null;
+    return {
+        name: text(selectors.name),
+        quantity: text(selectors.quantity),
+        price: text(selectors.price),
+    };
+})"""
+ITEM_FIELD_SELECTORS = {"name": ITEM_NAME_SELECTOR, "quantity": ITEM_QUANTITY_SELECTOR, "price": ITEM_PRICE_SELECTOR}
+
+# Reads the header fields of an order's details page in a single browser round-trip:
+# the item count line, the line following the "Order summary" heading, and whether
+# a "Download Invoice" button exists. Missing text fields come back as null.
+# The heading is the innermost div whose own text is exactly "Order summary" (the
+# element the exact get_by_text wait matched); its wrappers carry the same text, so
+# any div that contains another candidate is skipped.
+EXTRACT_HEADER_JS = """([itemCountSelector, itemCountPattern]) => {
+    const itemCountRe = new RegExp(itemCountPattern);
+    const itemCount = Array.from(document.querySelectorAll(itemCountSelector)).find(div => itemCountRe.test(div.innerText));
+    const headings = Array.from(document.querySelectorAll('div')).filter(div =>
+        div.textContent.trim() === 'Order summary' && div.nextElementSibling?.tagName === 'DIV');
+    const summary = headings.find(div => !headings.some(other => other !== div && div.contains(other)));
+    const hasInvoice = Array.from(document.querySelectorAll('button')).some(button =>
+        button.textContent.toLowerCase().includes('download invoice'));
+    return {
+        itemCount: itemCount ? itemCount.innerText : null,
+        arrivalStatus: summary ? summary.nextElementSibling.innerText : null,
+        hasInvoice: hasInvoice,
+    };
+}"""
+
+# Reads the details line (the first div containing the "•" separator) and the
+# status line of every rendered order card in a single browser round-trip.
+EXTRACT_ORDER_CARDS_JS = """(cards, statusSelector) => cards.map(card => {
+    const details = Array.from(card.querySelectorAll('div')).find(div => div.innerText.includes('•'));
+    const status = card.querySelector(statusSelector);
+    return {details: details ? details.innerText : null, status: status ? status.innerText : null};
+})"""
+
+# Scrolls the 'My Orders' list inside the browser until a card containing both
+# needles has rendered, the list stops growing, or the attempt limit is hit. Text is
+# matched the way Playwright's has_text does: on the text content, case-insensitively,
+# and with runs of whitespace (including NBSP and newlines) collapsed to one space.
+# Returns the number of scrolls made.
+SCROLL_TO_ORDER_CARD_JS = """async ([cardSelector, needles, maxAttempts, growthTimeoutMs]) => {
+    const normalize = text => text.replace(/\\s+/g, ' ').trim().toLowerCase();
+    const wanted = needles.map(normalize);
+    const found = () => Array.from(document.querySelectorAll(cardSelector)).some(card => {
+        const text = normalize(card.textContent);
+        return wanted.every(needle => text.includes(needle));
+    });
+    const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+    for (let attempt = 0; attempt < maxAttempts; attempt++) {
+        if (found()) return attempt;
+        const lastHeight = document.body.scrollHeight;
+        window.scrollTo(0, lastHeight);
+        const deadline = Date.now() + growthTimeoutMs;
+        while (document.body.scrollHeight <= lastHeight && Date.now() < deadline) await sleep(100);
+        if (document.body.scrollHeight <= lastHeight) return attempt + 1;
+    }
+    return maxAttempts;
+}"""
+
+# Resolves once a scroll on an order's details page has had a visible effect: the
+# number of item rows changed, the last row is a different item, or the page has
+# reached the bottom, where no further rows can load.
+SCROLL_SETTLED_JS = """([rowSelector, nameSelector, rowCount, lastName]) => {
+    const rows = document.querySelectorAll(rowSelector);
+    if (rows.length !== rowCount) return true;
+    const last = rows.length ? rows[rows.length - 1].querySelector(nameSelector)?.innerText ?? null : null;
+    if (last !== lastName) return true;
+    return window.innerHeight + window.scrollY >= document.body.scrollHeight - 2;
+}"""
+
+# Regular expressions used while parsing scraped text, compiled once at import.
+_RE_AMOUNT = re.compile(r'₹([\d,]+)')
+_RE_NON_DIGITS = re.compile(r'[^\d]')
+_RE_NON_NUMERIC = re.compile(r'[^\d.-]')
+_RE_FIRST_INT = re.compile(r'(\d+)')
+_RE_ITEM_COUNT = re.compile(r'item(s)? in this order')
+_RE_HEADER_ITEM_COUNT = re.compile(r'^\s*(\d+)\s+items?\s+in this order', re.IGNORECASE)
+_RE_ARRIVAL_TIME = re.compile(r'(\d{1,2}:\d{2}\s*(?:am|pm))', re.IGNORECASE)
+
+# The number of order details pages scraped concurrently during Phase 2, and the most
+# BLINKIT_CONCURRENCY may raise it to. More tabs than that in one logged-in session
+# risks Blinkit's rate limiting and bot detection.
+MAX_CONCURRENT_ORDERS = 5
+CONCURRENCY_LIMIT = 10
+
+# Orders whose details have been fully scraped are kept here between runs, so re-runs
+# only need to open the details pages of orders that are new since the last run.
+ORDER_CACHE_FILE = "orders_cache.json"
+# Bumped whenever the shape of a cached order changes. A cache written under another
+# version, or for other export columns, is discarded and rebuilt.
+ORDER_CACHE_VERSION = 1
+
+# Words in an order's arrival status that mean it has been delivered. Orders still in
+# progress are never cached, so their final details are scraped on a later run.
+COMPLETED_STATUS_WORDS = ("arrived", "delivered")
+
+# Third-party analytics and ad hosts. Nothing on them is needed to render or scrape
+# the order pages, so their scripts and beacons are blocked outright.
+BLOCKED_HOSTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "facebook.net", "segment.io", "segment.com", "hotjar.com",
+)
+
+# File extensions of the images, media and fonts the scraper never reads. Stylesheets
+# are deliberately not listed, because the visibility checks used throughout depend
+# on the page's real layout.
+BLOCKED_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico",
+    "mp4", "webm", "mp3", "woff", "woff2", "ttf", "otf", "eot",
+)
+
+# Only URLs matching this pattern are routed, so every other request goes straight to
+# the network instead of taking a round-trip through a Python handler.
+BLOCKED_URL_PATTERN = re.compile(
+    r"^https?://(?:[^/?#]*\.)?(?:" + "|".join(re.escape(host) for host in BLOCKED_HOSTS) + r")(?::\d+)?(?:[/?#]|$)"
+    r"|^[^?#]*\.(?:" + "|".join(BLOCKED_EXTENSIONS) + r")(?:[?#]|$)",
+    re.IGNORECASE,
+)
 
 # ==============================================================================
 # --- AUTHENTICATION AND PAGE SETUP FUNCTIONS ---
 # ==============================================================================
 
+async def block_unused_resources(route: Route):
+    """
+    Route handler that aborts requests for images, media, fonts and analytics.
+
+    Product thumbnails make up most of the bytes on the order pages, but the scraper
+    only ever reads text, so skipping them makes every navigation and scroll cheaper.
+    It is only registered for BLOCKED_URL_PATTERN, so every request it sees is aborted.
+
+    Args:
+        route (Route): The intercepted request route.
+    """
+    await route.abort()
+
 async def set_location_and_login_prep(page: Page):
     """
     Handles the initial page load for a first-time run.
@@ -25,48 +213,48 @@ async def set_location_and_login_prep(page: Page):
     # An optional "Download App" pop-up can sometimes appear on the first visit.
     # This block safely clicks the "Continue on web" button if it exists,
     # with a short timeout to avoid delaying the script if it's not present.
-    print("LOG: Checking for the 'Download App' pop-up...")
+    log.info("Checking for the 'Download App' pop-up...")
     try:
         continue_button = page.locator('button:has-text("Continue on web")')
         await continue_button.click(timeout=7000)
-        print("LOG: 'Download App' pop-up found and dismissed.")
+        log.info("'Download App' pop-up found and dismissed.")
     except TimeoutError:
-        print("LOG: 'Download App' pop-up did not appear. Continuing.")
+        log.info("'Download App' pop-up did not appear. Continuing.")
 
     # This is the main, mandatory workflow for setting a delivery location.
-    print("\nLOG: Starting the location setting process...")
+    log.info("Starting the location setting process...")
     try:
         # The locator uses an exact, case-sensitive match on the placeholder text,
         # which is more precise and reliable than a partial match.
         location_input = page.locator('input[placeholder="search delivery location"]')
         await expect(location_input).to_be_visible(timeout=20000)
-        print("LOG: Location input box found.")
+        log.info("Location input box found.")
 
         # Click the input to focus it, then type the desired location.
         location_query = "nirvana country"
         await location_input.click()
-        print(f"LOG: Typing '{location_query}' into the location search bar...")
+        log.info("Typing '%s' into the location search bar...", location_query)
         await location_input.fill(location_query)
 
         # This locator specifically targets the container for the suggestion list,
         # making it more stable than trying to match text directly.
         all_suggestions_locator = page.locator("div.LocationSearchList__LocationListContainer-sc-93rfr7-0")
 
-        print("LOG: Waiting for the location suggestions to appear...")
+        log.info("Waiting for the location suggestions to appear...")
         await expect(all_suggestions_locator.first).to_be_visible(timeout=10000)
 
         # A hard pause is used here as a safeguard against subtle animations or
         # front-end framework state updates that might not be fully captured by
         # Playwright's auto-waiting, ensuring the element is truly ready to be clicked.
-        print("LOG: Suggestions are visible. Pausing for 2 seconds before clicking...")
+        log.info("Suggestions are visible. Pausing for 2 seconds before clicking...")
         await page.wait_for_timeout(2000)
 
         await all_suggestions_locator.first.click()
-        print("LOG: Clicked on the first location suggestion.")
+        log.info("Clicked on the first location suggestion.")
 
         # To confirm the location was set successfully, we wait for the 'Login' button
         # to become visible on the now-accessible homepage.
-        print("LOG: Waiting for page to refresh and 'Login' button to appear...")
+        log.info("Waiting for page to refresh and 'Login' button to appear...")
 
         # A hard wait is added here to ensure the page has time to reload after location selection.
         # This prevents a race condition where the script looks for the Login button too quickly.
@@ -74,10 +262,10 @@ async def set_location_and_login_prep(page: Page):
 
         login_button = page.get_by_text("Login", exact=True)
         await expect(login_button).to_be_visible(timeout=15000)
-        print("LOG: Login button is visible. Ready for the login flow.")
+        log.info("Login button is visible. Ready for the login flow.")
 
     except TimeoutError as e:
-        print(f"CRITICAL ERROR: A timeout occurred while setting the location. The script cannot continue. Error: {e}")
+        log.error("A timeout occurred while setting the location. The script cannot continue. Error: %s", e)
         raise
 
 async def login_to_blinkit(page: Page):
@@ -90,29 +278,29 @@ async def login_to_blinkit(page: Page):
         login_button = page.get_by_text("Login", exact=True)
         await expect(login_button).to_be_visible(timeout=10000)
         await login_button.click()
-        print("LOG: Login button clicked.")
+        log.info("Login button clicked.")
 
         # A deliberate pause prevents a race condition by waiting for the phone number
         # modal to finish animating and become interactive before proceeding.
-        print("LOG: Pausing for 1.5s to allow login modal to render...")
+        log.info("Pausing for 1.5s to allow login modal to render...")
         await page.wait_for_timeout(1500)
 
         # Now, it is safe to look for the mobile input field.
         mobile_input = page.locator('[data-test-id="phone-no-text-box"]')
         await expect(mobile_input).to_be_visible(timeout=10000)
-        print("LOG: Mobile number pop-up is visible.")
+        log.info("Mobile number pop-up is visible.")
 
         phone_number = input("👉 Please enter your 10-digit mobile number: ")
         if len(phone_number) != 10 or not phone_number.isdigit():
             raise ValueError("Invalid phone number. It must be 10 digits.")
         await mobile_input.fill(phone_number)
-        print(f"LOG: Mobile number '{phone_number}' entered.")
+        log.info("Mobile number '%s' entered.", phone_number)
 
         await page.locator('button:has-text("Continue")').click()
-        print("LOG: Continue button clicked.")
+        log.info("Continue button clicked.")
 
         # Another pause waits for the UI to transition from the phone number screen to the OTP screen.
-        print("LOG: Pausing for 1.5s to allow OTP modal to render...")
+        log.info("Pausing for 1.5s to allow OTP modal to render...")
         await page.wait_for_timeout(1500)
 
         # The OTP entry is wrapped in a loop to allow for multiple attempts,
@@ -121,7 +309,7 @@ async def login_to_blinkit(page: Page):
         for attempt in range(1, max_attempts + 1):
             print(f"\n--- OTP Attempt {attempt}/{max_attempts} ---")
             await expect(page.locator('text="OTP Verification"')).to_be_visible(timeout=10000)
-            print("LOG: OTP Verification pop-up is visible.")
+            log.info("OTP Verification pop-up is visible.")
 
             otp = input("👉 Please enter the 4-digit OTP you received: ")
             if len(otp) != 4 or not otp.isdigit():
@@ -136,15 +324,14 @@ async def login_to_blinkit(page: Page):
                 await page.keyboard.press(select_all)
                 await page.keyboard.press("Backspace")
 
-            # Simulate typing each digit individually to work with auto-advancing input fields.
-            print(f"LOG: Entering OTP '{otp}' digit by digit...")
-            for digit in otp:
-                await page.keyboard.press(digit)
-                await page.wait_for_timeout(100)
-            print("LOG: Full OTP has been entered.")
+            # The OTP boxes auto-advance on each keystroke, so the digits are typed as
+            # real key events in one call rather than filled into a single input.
+            log.info("Entering OTP '%s'...", otp)
+            await page.keyboard.type(otp)
+            log.info("Full OTP has been entered.")
 
             try:
-                print("LOG: Waiting for final login confirmation...")
+                log.info("Waiting for final login confirmation...")
                 account_button = page.get_by_text("Account", exact=True)
                 # Increased timeout for slow logins, giving the backend more time to process the OTP.
                 await expect(account_button).to_be_visible(timeout=20000)
@@ -154,7 +341,7 @@ async def login_to_blinkit(page: Page):
                 return # Exit the function on successful login.
 
             except TimeoutError:
-                print("\nLOG: Login did not complete successfully. OTP may be incorrect or expired.")
+                log.info("Login did not complete successfully. OTP may be incorrect or expired.")
                 if attempt < max_attempts:
                     try:
                         # If login fails, check if the "Resend Code" button is available.
@@ -163,7 +350,7 @@ async def login_to_blinkit(page: Page):
                         user_choice = input("👉 Would you like to resend the OTP? (y/n): ").lower()
                         if user_choice == 'y':
                             await resend_button.click()
-                            print("LOG: 'Resend Code' clicked. A new OTP will be sent.")
+                            log.info("'Resend Code' clicked. A new OTP will be sent.")
                             # Add a small pause after clicking resend to allow UI to update.
                             await page.wait_for_timeout(1000)
                             continue # Continue to the next iteration of the loop.
@@ -177,20 +364,102 @@ async def login_to_blinkit(page: Page):
         raise Exception("Failed to log in after multiple OTP attempts.")
 
     except TimeoutError as e:
-        print(f"\nCRITICAL ERROR: A timeout occurred during the login process. Error: {e}")
+        log.error("A timeout occurred during the login process. Error: %s", e)
         raise
     except ValueError as e:
-        print(f"\nINPUT ERROR: {e}")
+        log.error("Invalid input: %s", e)
         raise
     except Exception as e:
-        print(f"\n❌ An error occurred during login: {e}")
+        log.error("An error occurred during login: %s", e)
         raise
 
 # ==============================================================================
 # --- DATA PARSING AND SCRAPING FUNCTIONS ---
 # ==============================================================================
 
-def parse_order_date(date_str: str, previous_date: datetime = None) -> datetime:
+def parse_amount(amount_str: str) -> float:
+    """
+    Converts a scraped currency string (e.g. "₹1,234", "-₹20" or "FREE") to a number.
+
+    Args:
+        amount_str (str): The amount text scraped from the website.
+
+    Returns:
+        float: The amount, or 0 if the text contains no number.
+    """
+    cleaned = _RE_NON_NUMERIC.sub('', amount_str)
+    try:
+        return float(cleaned) if cleaned else 0.0
+    except ValueError:
+        log.warning("Could not parse the amount '%s'. Using 0.", amount_str)
+        return 0.0
+
+def _parse_hm_ampm(time_str: str) -> tuple[int, int]:
+    """
+    Parses a fixed-format "H:MM AM/PM" time string (e.g. "10:30 PM") by hand.
+
+    The format never varies, so splitting the string is much cheaper than having
+    `datetime.strptime` re-tokenize a format string on every call.
+
+    Args:
+        time_str (str): The time string to parse.
+
+    Returns:
+        tuple[int, int]: The hour (0-23) and minute.
+
+    Raises:
+        ValueError: If the string is not a valid "H:MM AM/PM" time.
+    """
+    clock, meridiem = time_str.strip().rsplit(' ', 1)
+    hour_str, minute_str = clock.split(':')
+    hour, minute, meridiem = int(hour_str), int(minute_str), meridiem.upper()
+    if not 1 <= hour <= 12 or not 0 <= minute <= 59 or meridiem not in ("AM", "PM"):
+        raise ValueError(f"Invalid time: '{time_str}'")
+    return hour % 12 + (12 if meridiem == "PM" else 0), minute
+
+# Month abbreviations as they appear in Blinkit dates such as "15 Aug, 10:30 PM".
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+@lru_cache(maxsize=4096)
+def _parse_order_date_str(date_str: str, today: date) -> datetime:
+    """
+    Parses a single Blinkit date string relative to `today`, without any year-rollover
+    correction.
+
+    The result depends only on its two arguments, so it is memoized: the same card
+    dates are seen again on every scroll pass and are only parsed once.
+
+    Args:
+        date_str (str): The date string scraped from the website.
+        today (date): The date that "Today" refers to.
+
+    Returns:
+        datetime: The parsed datetime, assuming the current year.
+
+    Raises:
+        ValueError, IndexError: If the string is not in a recognised format.
+    """
+    # All three formats are "<day part>, H:MM AM/PM", so they are split by hand
+    # instead of going through strptime's format parsing and locale lookups.
+    day_part, time_part = date_str.split(',', 1)
+    hour, minute = _parse_hm_ampm(time_part)
+    day_part_lower = day_part.strip().lower()
+    if "today" in day_part_lower:
+        order_day = today
+    elif "yesterday" in day_part_lower:
+        order_day = today - timedelta(days=1)
+    else:
+        # Assume the current year initially for dates like "15 Aug, 10:30 PM".
+        day_str, month_str = day_part_lower.split()
+        if month_str not in _MONTHS:
+            raise ValueError(f"Unknown month: '{month_str}'")
+        order_day = date(today.year, _MONTHS[month_str], int(day_str))
+    return datetime.combine(order_day, time(hour, minute))
+
+def parse_order_date(date_str: str, previous_date: datetime = None, today: date = None) -> datetime:
     """
     Parses colloquial date/time formats from Blinkit into a standard datetime object.
 
@@ -201,25 +470,14 @@ def parse_order_date(date_str: str, previous_date: datetime = None) -> datetime:
     Args:
         date_str (str): The date string scraped from the website.
         previous_date (datetime, optional): The datetime of the previously parsed order.
+        today (date, optional): The date that "Today" refers to. Callers parsing many
+            dates should compute it once and pass it in; defaults to `date.today()`.
 
     Returns:
         datetime: A standardized datetime object.
     """
-    today = date.today()
-    date_str_lower = date_str.lower()
-    parsed_date = None
     try:
-        if "today" in date_str_lower:
-            time_part = date_str.split(',')[1].strip()
-            parsed_date = datetime.strptime(f"{today.strftime('%Y-%m-%d')} {time_part}", "%Y-%m-%d %I:%M %p")
-        elif "yesterday" in date_str_lower:
-            yesterday = today - timedelta(days=1)
-            time_part = date_str.split(',')[1].strip()
-            parsed_date = datetime.strptime(f"{yesterday.strftime('%Y-%m-%d')} {time_part}", "%Y-%m-%d %I:%M %p")
-        else:
-            # Assume the current year initially for dates like "15 Aug, 10:30 PM".
-            full_date_str = f"{date_str} {today.year}"
-            parsed_date = datetime.strptime(full_date_str, "%d %b, %I:%M %p %Y")
+        parsed_date = _parse_order_date_str(date_str, today or date.today())
 
         # If a previous date is known and the new date is newer, it means we've
         # crossed a year boundary (e.g., from Jan '25 to Dec '24). Decrement the year.
@@ -246,6 +504,153 @@ def get_start_date_from_user() -> date:
         except ValueError:
             print("\n❌ Invalid format. Please use the YYYY-MM-DD format. Example: 2025-08-01")
 
+def get_max_concurrency() -> int:
+    """
+    Reads how many orders to scrape at once from the BLINKIT_CONCURRENCY environment
+    variable, falling back to MAX_CONCURRENT_ORDERS if it is unset or invalid. Values
+    above CONCURRENCY_LIMIT are lowered to it.
+
+    Returns:
+        int: The maximum number of order details pages to scrape concurrently.
+    """
+    value = os.environ.get("BLINKIT_CONCURRENCY")
+    if value is None:
+        return MAX_CONCURRENT_ORDERS
+    try:
+        max_concurrency = int(value)
+        if max_concurrency < 1: raise ValueError
+    except ValueError:
+        log.warning("BLINKIT_CONCURRENCY must be a positive whole number, not '%s'. Using %d.", value, MAX_CONCURRENT_ORDERS)
+        return MAX_CONCURRENT_ORDERS
+    if max_concurrency > CONCURRENCY_LIMIT:
+        log.warning("BLINKIT_CONCURRENCY is capped at %d to avoid rate limiting, not %d. Using %d.", CONCURRENCY_LIMIT, max_concurrency, CONCURRENCY_LIMIT)
+        max_concurrency = CONCURRENCY_LIMIT
+    log.info("Scraping up to %d orders at once (BLINKIT_CONCURRENCY).", max_concurrency)
+    return max_concurrency
+
+# The level names BLINKIT_LOG accepts, mapped to their logging levels.
+LOG_LEVELS = {name: getattr(logging, name) for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")}
+
+def configure_logging():
+    """
+    Configures the script's logging. Step-by-step progress messages are opt-in through
+    the '--verbose' flag or the BLINKIT_LOG environment variable (a level name such as
+    INFO, or a numeric level); by default only warnings and errors are shown.
+    """
+    value = os.environ.get("BLINKIT_LOG", "WARNING").strip()
+    if '--verbose' in sys.argv:
+        level, invalid = logging.INFO, False
+    elif value.isdigit():
+        level, invalid = int(value), False
+    else:
+        level, invalid = LOG_LEVELS.get(value.upper(), logging.WARNING), value.upper() not in LOG_LEVELS
+    # Only this script's logger is configured, so asyncio and other libraries keep
+    # their own defaults even when '--verbose' or BLINKIT_LOG=DEBUG is used.
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    log.addHandler(handler)
+    log.setLevel(level)
+    log.propagate = False
+    if invalid:
+        log.warning("BLINKIT_LOG must be one of %s or a number, not '%s'. Using WARNING.", ", ".join(LOG_LEVELS), value)
+
+def _order_cache_key(summary_data: dict) -> str:
+    """
+    Builds the cache key of an order from its Phase 1 summary.
+
+    The resolved order datetime is used rather than the on-page date string, because
+    strings like "Today, 10:30 pm" become "Yesterday, 10:30 pm" on the next day.
+    """
+    return f"{summary_data['order_datetime'].isoformat()}|{summary_data['bill_total_from_list']}"
+
+def _order_cache_schema() -> list:
+    """
+    Describes the layout the cached orders were written for: the cache version and the
+    columns of both exported sheets. Entries saved under a different schema are stale.
+    """
+    return [ORDER_CACHE_VERSION, list(SUMMARY_EXPORT_COLUMNS), list(ITEM_EXPORT_COLUMNS)]
+
+def is_order_complete(summary: dict, items: list[dict]) -> bool:
+    """
+    Checks whether an order was scraped completely enough to be cached for good.
+
+    The order must be delivered, every header and bill field must have been read, and
+    the number of items scraped must match the count stated in the header.
+
+    Args:
+        summary (dict): The order's merged summary.
+        items (list[dict]): The order's scraped items.
+
+    Returns:
+        bool: True if the order can be served from the cache on later runs.
+    """
+    if not summary.get("order_id") or not summary.get("arrival_status"):
+        return False
+    if any(field not in summary for field in ("total_item_count", "invoice_download_link", *BILL_FIELD_LABELS)):
+        return False
+    if not any(word in summary["arrival_status"].lower() for word in COMPLETED_STATUS_WORDS):
+        return False
+    count_match = _RE_HEADER_ITEM_COUNT.search(summary["total_item_count"])
+    return bool(count_match) and len(items) == int(count_match.group(1))
+
+def load_order_cache() -> dict:
+    """
+    Loads the cache of previously scraped orders from ORDER_CACHE_FILE.
+
+    Returns:
+        dict: A mapping of cache key to {"summary": dict, "items": list[dict]}, or an
+              empty dict if there is no usable cache file or it was written under an
+              older schema.
+    """
+    if not os.path.exists(ORDER_CACHE_FILE):
+        return {}
+    try:
+        with open(ORDER_CACHE_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("schema") != _order_cache_schema():
+            log.info("Ignoring '%s', which was written for a different cache schema.", ORDER_CACHE_FILE)
+            return {}
+        cache = data["orders"]
+        for entry in cache.values():
+            entry["summary"]["order_datetime"] = datetime.fromisoformat(entry["summary"]["order_datetime"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        log.warning("Ignoring unreadable order cache '%s'. Error: %s", ORDER_CACHE_FILE, e)
+        return {}
+    log.info("Loaded %d previously scraped orders from '%s'.", len(cache), ORDER_CACHE_FILE)
+    return cache
+
+def save_order_cache(cache: dict):
+    """
+    Writes the order cache to ORDER_CACHE_FILE, via a temporary file so that an
+    interrupted run can never leave a half-written cache behind.
+    """
+    temp_path = f"{ORDER_CACHE_FILE}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({"schema": _order_cache_schema(), "orders": cache}, f,
+                  ensure_ascii=False, default=lambda value: value.isoformat())
+    os.replace(temp_path, ORDER_CACHE_FILE)
+
+async def _wait_for_scroll_to_settle(page: Page, previous_row_count: int, previous_last_name: str, timeout_ms: int = 1000):
+    """
+    Waits after a scroll on an order's details page until new content has rendered.
+
+    Rather than sleeping, a single in-page predicate (SCROLL_SETTLED_JS) is polled
+    by the browser and resolves on the first real signal. If nothing changes within
+    the short timeout, the scroll produced no new rows and the wait simply ends.
+
+    Args:
+        page (Page): The Playwright page object on an order details view.
+        previous_row_count (int): The number of item rows rendered before the scroll.
+        previous_last_name (str): The name of the last item row before the scroll.
+        timeout_ms (int, optional): The longest time to wait, in milliseconds.
+    """
+    try:
+        await page.wait_for_function(
+            SCROLL_SETTLED_JS, arg=[ITEM_ROW_SELECTOR, ITEM_NAME_SELECTOR, previous_row_count, previous_last_name],
+            timeout=timeout_ms)
+    except TimeoutError:
+        pass
+
 async def scrape_order_details(page: Page) -> dict:
     """
     Scrapes detailed information from a single order's page using a top-to-bottom strategy.
@@ -257,83 +662,103 @@ async def scrape_order_details(page: Page) -> dict:
         dict: A dictionary containing scraped details for one order.
     """
     details = {"summary": {}, "items": []}
-    print("      LOG: Now on details page. Waiting for the page to become interactive...")
-    await page.wait_for_load_state('networkidle', timeout=20000)
-    print("      LOG: Network is idle. Beginning top-to-bottom scrape.")
+    # No 'networkidle' wait here: background analytics requests can keep it from
+    # firing long after the page is usable. The 'Order summary' visibility check
+    # below is what actually guarantees the content has rendered.
+    log.info("Now on details page. Beginning top-to-bottom scrape.")
 
     # --- PHASE A: Scrape the Top of the Page (Order Summary) ---
     summary_data = details["summary"]
     try:
-        print("      LOG: Scraping header details...")
+        log.info("Scraping header details...")
         await expect(page.get_by_text("Order summary", exact=True)).to_be_visible(timeout=15000)
 
         # Use regex to match both "item" and "items" for robustness.
-        item_count_locator = page.locator("div.tw-text-400.tw-font-bold", has_text=re.compile(r'item(s)? in this order'))
+        item_count_locator = page.locator(ITEM_COUNT_SELECTOR, has_text=_RE_ITEM_COUNT)
         await expect(item_count_locator).to_be_visible(timeout=5000)
-        summary_data['total_item_count'] = await item_count_locator.inner_text()
-        summary_data['arrival_status'] = await page.locator("div:has-text('Order summary') + div").first.inner_text()
-        summary_data['invoice_download_link'] = 'Yes' if await page.locator("button:has-text('Download Invoice')").count() > 0 else 'No'
-        print("      LOG: Successfully scraped header details.")
+        # Once the header has rendered, all of its fields are read in one evaluate
+        # rather than one locator round-trip each.
+        header = await page.evaluate(EXTRACT_HEADER_JS, [ITEM_COUNT_SELECTOR, _RE_ITEM_COUNT.pattern])
+        if header["itemCount"] is None: raise ValueError("The item count line was not found.")
+        summary_data['total_item_count'] = header["itemCount"]
+        if header["arrivalStatus"] is None: raise ValueError("The arrival status line was not found.")
+        summary_data['arrival_status'] = header["arrivalStatus"]
+        summary_data['invoice_download_link'] = 'Yes' if header["hasInvoice"] else 'No'
+        log.info("Successfully scraped header details.")
     except Exception as e:
-        print(f"      [!] Warning: Could not parse order summary section. Error: {e}")
+        log.warning("Could not parse order summary section. Error: %s", e)
 
     # --- PHASE B: Iteratively Scroll to Scrape All Items ---
-    print("      LOG: Beginning iterative scroll to scrape all items...")
-    processed_item_texts = set()
+    log.info("Beginning iterative scroll to scrape all items...")
+    processed_item_keys: set[tuple] = set()
+    # The header states how many items the order contains. Once that many rows have
+    # been read the list is complete, so the final "no new items" scroll is skipped.
+    # The count is only trusted when the header reads exactly "N item(s) in this order".
+    count_match = _RE_HEADER_ITEM_COUNT.search(summary_data.get('total_item_count', ''))
+    expected_item_count = int(count_match.group(1)) if count_match else None
     while True:
-        visible_items = await page.locator("div.tw-flex-row:has(img):has(div.tw-text-300.tw-font-medium)").all()
+        # A single evaluate_all returns the fields of every rendered row, instead of
+        # several inner_text round-trips per row.
+        visible_items = await page.locator(ITEM_ROW_SELECTOR).evaluate_all(EXTRACT_ITEMS_JS, ITEM_FIELD_SELECTORS)
         new_items_found = False
-        for item_element in visible_items:
-            item_id = await item_element.inner_text()
-            if item_id in processed_item_texts:
+        for fields in visible_items:
+            # Rows are deduplicated on their extracted fields rather than their full
+            # text, which never has to be sent back from the browser.
+            # A row that is still partly rendered is not recorded, so it is read again
+            # in full on a later pass rather than being counted under a partial key.
+            if fields["name"] is None or fields["quantity"] is None or fields["price"] is None:
+                continue
+            item_key = (fields["name"], fields["quantity"], fields["price"])
+            if item_key in processed_item_keys:
                 continue
             new_items_found = True
-            processed_item_texts.add(item_id)
+            processed_item_keys.add(item_key)
             try:
-                name = await item_element.locator("div.tw-text-300.tw-font-medium").first.inner_text()
-                quantity = await item_element.locator("div.tw-text-200.tw-font-regular").first.inner_text()
-                price_text = await item_element.locator("div.tw-text-200.tw-font-bold").first.inner_text()
                 details["items"].append({
-                    "product_name": name, "quantity": quantity, "price": int(re.sub(r'[^\d]', '', price_text))
+                    "product_name": fields["name"], "quantity": fields["quantity"], "price": int(_RE_NON_DIGITS.sub('', fields["price"]))
                 })
-            except (TimeoutError, ValueError):
+            except ValueError:
                 continue
         if not new_items_found:
-            print("      LOG: No new items found on scroll. Item list is complete.")
+            log.info("No new items found on scroll. Item list is complete.")
+            break
+        if expected_item_count and len(details["items"]) >= expected_item_count:
+            log.info("All %d items listed in the header have been read.", expected_item_count)
             break
-        print(f"      LOG: Scraped {len(details['items'])} items so far. Scrolling down...")
+        # The bill details sit below the item list, so once the page is scrolled to the
+        # bottom every item has been rendered and read; another PageDown can't add any.
+        if await page.evaluate("window.innerHeight + window.scrollY >= document.body.scrollHeight - 2"):
+            log.info("Reached the bottom of the page. Item list is complete.")
+            break
+        log.info("Scraped %d items so far. Scrolling down...", len(details['items']))
         await page.keyboard.press("PageDown")
-        await page.wait_for_timeout(1500)
-    print(f"      LOG: Finished scraping all {len(details['items'])} items.")
+        await _wait_for_scroll_to_settle(page, len(visible_items), visible_items[-1]["name"] if visible_items else None)
+    if expected_item_count is not None and len(details["items"]) != expected_item_count:
+        log.warning("The header lists %d items, but %d were scraped.", expected_item_count, len(details["items"]))
+    log.info("Finished scraping all %d items.", len(details['items']))
 
     # --- PHASE C: Scrape the Bottom of the Page (Bill Details) ---
-    print("      LOG: Scrolling to bottom to find order details...")
+    log.info("Scrolling to bottom to find order details...")
+    # No fixed pause after the scroll: the Order ID visibility check below already
+    # waits exactly as long as the bottom of the page takes to render.
     await page.keyboard.press("End")
-    await page.wait_for_timeout(1500)
 
     bill_data = details["summary"]
     try:
         order_id_locator = page.locator("button:has-text('ORD')")
         await expect(order_id_locator).to_be_visible(timeout=10000)
         bill_data['order_id'] = (await order_id_locator.inner_text()).strip()
-        print(f"      LOG: Scraped Order ID: {bill_data['order_id']}")
+        log.info("Scraped Order ID: %s", bill_data['order_id'])
 
-        async def get_bill_value(label: str) -> str:
-            try:
-                container = page.locator(f"div.tw-flex.tw-w-full.tw-flex-row:has(div:text-is('{label}'))")
-                await container.wait_for(state="visible", timeout=3000)
-                return await container.locator("div").last.inner_text()
-            except TimeoutError:
-                return "0"
-        bill_data['mrp'] = await get_bill_value('MRP')
-        bill_data['product_discount'] = await get_bill_value('Product discount')
-        bill_data['item_total'] = await get_bill_value('Item total')
-        bill_data['handling_charge'] = await get_bill_value('Handling charge')
-        bill_data['delivery_charges'] = await get_bill_value('Delivery charges')
-        bill_data['bill_total'] = await get_bill_value('Bill total')
-        print("      LOG: Bill details scraped successfully.")
+        # The whole bill block is read in one evaluate, so a label that is missing
+        # from this order simply defaults to 0 instead of costing a timeout. Values
+        # are converted to numbers here, where a bad value can be reported.
+        bill_values = await page.evaluate(EXTRACT_BILL_JS, [BILL_ROW_SELECTOR, list(BILL_FIELD_LABELS.values())])
+        for field, label in BILL_FIELD_LABELS.items():
+            bill_data[field] = parse_amount(bill_values[label]) if label in bill_values else 0
+        log.info("Bill details scraped successfully.")
     except Exception as e:
-        print(f"      [!] Warning: Could not parse bill details section. Error: {e}")
+        log.warning("Could not parse bill details section. Error: %s", e)
     return details
 
 async def _scrape_all_summaries(page: Page, start_date: date) -> list[dict]:
@@ -346,36 +771,49 @@ async def _scrape_all_summaries(page: Page, start_date: date) -> list[dict]:
     processed_unique_ids = set()
     stop_scraping = False
     last_known_date = None
+    processed_card_count = 0
+    # Resolved once so every card in this collection is dated against the same day.
+    today = date.today()
+    # Locators are lazy queries, so one built up front stays valid across scrolls.
+    order_cards_locator = page.locator(ORDER_CARD_SELECTOR)
 
     while not stop_scraping:
-        order_cards_locator = page.locator('div.tw-flex.tw-flex-col:has(span.icon-right-arrow)')
         try:
             await expect(order_cards_locator.first).to_be_visible(timeout=10000)
         except TimeoutError:
-            print("LOG: No order cards found on the page. Ending summary collection.")
+            log.info("No order cards found on the page. Ending summary collection.")
             break
-        for card in await order_cards_locator.all():
+        # All rendered cards are read in one evaluate_all. The list only ever grows at
+        # the bottom, so parsing resumes where the previous pass left off. A card whose
+        # details line had not rendered yet is left for the next pass, which resumes at
+        # it; cards re-read after it are skipped by processed_unique_ids.
+        cards = await order_cards_locator.evaluate_all(EXTRACT_ORDER_CARDS_JS, ORDER_STATUS_SELECTOR)
+        next_card_index = len(cards)
+        for card_index in range(processed_card_count, len(cards)):
+            card = cards[card_index]
             try:
-                details_locator = card.locator('div:has-text("•")')
-                if await details_locator.count() == 0: continue
-                details_text = await details_locator.first.inner_text()
-                amount_match = re.search(r'₹([\d,]+)', details_text)
+                details_text = card["details"]
+                if details_text is None:
+                    next_card_index = min(next_card_index, card_index)
+                    continue
+                amount_match = _RE_AMOUNT.search(details_text)
                 total_amount_str = amount_match.group(1) if amount_match else "0"
                 total_amount = int(total_amount_str.replace(',', ''))
                 date_str = details_text.split('•')[1].strip()
-                unique_key = f"{date_str}-{total_amount}"
+                unique_key = (date_str, total_amount)
                 if unique_key in processed_unique_ids: continue
                 processed_unique_ids.add(unique_key)
-                order_datetime = parse_order_date(date_str, previous_date=last_known_date)
+                order_datetime = parse_order_date(date_str, previous_date=last_known_date, today=today)
                 last_known_date = order_datetime
                 if order_datetime.date() < start_date:
-                    print(f"\nLOG: Found an order from {order_datetime.strftime('%d %b, %Y')}, which is before the start date. Stopping.")
+                    log.info("Found an order from %s, which is before the start date. Stopping.", order_datetime.strftime('%d %b, %Y'))
                     stop_scraping = True
                     break
-                status_text = await card.locator('div.tw-text-500').first.inner_text()
+                status_text = card["status"]
+                if status_text is None: raise ValueError("The order status line was not found.")
                 delivery_time_mins = 0
                 if "arrived in" in status_text.lower():
-                    delivery_match = re.search(r"(\d+)", status_text)
+                    delivery_match = _RE_FIRST_INT.search(status_text)
                     if delivery_match: delivery_time_mins = int(delivery_match.group(1))
                 summaries_to_process.append({
                     "order_datetime": order_datetime, "bill_total_from_list": total_amount,
@@ -383,31 +821,90 @@ async def _scrape_all_summaries(page: Page, start_date: date) -> list[dict]:
                     "unique_date_str": date_str,
                 })
             except Exception as e:
-                print(f"  [!] Warning: Could not parse a summary card. Error: {e}")
+                log.warning("Could not parse a summary card. Error: %s", e)
                 continue
+        processed_card_count = next_card_index
         if stop_scraping: break
         card_count_before_scroll = await order_cards_locator.count()
-        print(f"LOG: Scrolling down from {card_count_before_scroll} visible summaries...")
+        log.info("Scrolling down from %d visible summaries...", card_count_before_scroll)
         await page.mouse.wheel(0, 10000)
         try:
-            await order_cards_locator.nth(card_count_before_scroll).wait_for(timeout=7000)
+            # A single in-page predicate waits for more cards to render, rather than
+            # Playwright re-resolving the whole card list on every poll.
+            await page.wait_for_function(
+                "([selector, count]) => document.querySelectorAll(selector).length > count",
+                arg=[ORDER_CARD_SELECTOR, card_count_before_scroll], timeout=7000)
         except TimeoutError:
-            print("\nLOG: Scrolled, but no new summaries loaded. Reached the end of the history.")
+            log.info("Scrolled, but no new summaries loaded. Reached the end of the history.")
             break
     return summaries_to_process
 
-async def scrape_orders_since(page: Page, start_date: date) -> tuple[list[dict], list[dict]]:
+async def _process_order(page: Page, summary_data: dict, my_orders_url: str) -> tuple[dict, list[dict]]:
+    """
+    PHASE 2 worker: finds one order's card on the 'My Orders' list, opens its details
+    page, and merges the scraped details with the summary collected in Phase 1.
+
+    Args:
+        page (Page): The tab this order is processed in.
+        summary_data (dict): The order's summary as collected in Phase 1.
+        my_orders_url (str): The URL of the 'My Orders' page.
+
+    Returns:
+        tuple[dict, list[dict]]: The merged order summary and its list of items.
+    """
+    active_my_orders_link = page.locator('a.profile-nav__list-item.active:has-text("My Orders")')
+    if not page.url == my_orders_url:
+        await page.goto(my_orders_url)
+        await expect(active_my_orders_link).to_be_visible(timeout=20000)
+    amount_str, date_str = summary_data['unique_amount_str'], summary_data['unique_date_str']
+    log.info("Searching for an order card containing BOTH '%s' AND '%s'...", amount_str, date_str)
+    # Both needles are literal strings, so they are matched as plain substrings
+    # rather than being escaped into regular expressions.
+    order_card = page.locator(ORDER_CARD_CONTAINER_SELECTOR).filter(has_text=amount_str).filter(has_text=date_str).first
+    if not await order_card.is_visible():
+        # The whole search runs inside the browser in one evaluate, instead of a
+        # scroll, a height check and a visibility check round-trip per attempt.
+        scroll_attempts = await page.evaluate(SCROLL_TO_ORDER_CARD_JS, [ORDER_CARD_CONTAINER_SELECTOR, [amount_str, date_str], 15, 5000])
+        log.info("Scrolled down %d times while searching for the order.", scroll_attempts)
+    if not await order_card.is_visible(): raise Exception(f"Could not find the order card after scrolling.")
+    log.info("Found unique order card. Clicking it now...")
+    await order_card.locator('div.tw-flex-row:has(span.icon-right-arrow)').first.click()
+    intermediate_page_locator = page.get_by_text("View Order Details", exact=True)
+    final_page_locator = page.get_by_text("Bill details", exact=True)
+    await expect(intermediate_page_locator.or_(final_page_locator)).to_be_visible(timeout=20000)
+    if await intermediate_page_locator.is_visible():
+        await intermediate_page_locator.click()
+        await expect(final_page_locator).to_be_visible(timeout=15000)
+    detailed_data = await scrape_order_details(page)
+    final_summary = {**summary_data, **detailed_data["summary"]}
+    if final_summary.get('delivery_time_minutes') == 0 and 'arrival_status' in final_summary:
+        try:
+            arrival_time_match = _RE_ARRIVAL_TIME.search(final_summary['arrival_status'])
+            if arrival_time_match:
+                hour, minute = _parse_hm_ampm(arrival_time_match.group(1))
+                arrival_datetime = summary_data['order_datetime'].replace(hour=hour, minute=minute, second=0, microsecond=0)
+                if arrival_datetime < summary_data['order_datetime']: arrival_datetime += timedelta(days=1)
+                final_summary['delivery_time_minutes'] = round((arrival_datetime - summary_data['order_datetime']).total_seconds() / 60)
+                log.info("Calculated delivery time: %d minutes.", final_summary['delivery_time_minutes'])
+        except Exception as e: log.warning("Failed to calculate delivery time. Error: %s", e)
+    order_id = final_summary.get("order_id")
+    for item in detailed_data["items"]:
+        item["order_id"] = order_id
+    return final_summary, detailed_data["items"]
+
+async def scrape_orders_since(page: Page, start_date: date, max_concurrency: int = MAX_CONCURRENT_ORDERS) -> tuple[list[dict], list[dict]]:
     """
     Orchestrates the two-phase scraping process:
     1. Scrape all order summaries from the main list.
-    2. Navigate to each order's detail page to scrape full data.
+    2. Navigate to each order's detail page to scrape full data, processing
+       up to `max_concurrency` orders at once in separate tabs.
     """
     my_orders_url = "https://blinkit.com/account/orders"
     print(f"\n--- Navigating to 'My Orders' page at {my_orders_url} ---")
     await page.goto(my_orders_url)
     active_my_orders_link = page.locator('a.profile-nav__list-item.active:has-text("My Orders")')
     await expect(active_my_orders_link).to_be_visible(timeout=20000)
-    print("LOG: 'My Orders' page loaded successfully.")
+    log.info("'My Orders' page loaded successfully.")
     orders_to_process = await _scrape_all_summaries(page, start_date)
     if not orders_to_process: return [], []
 
@@ -416,61 +913,104 @@ async def scrape_orders_since(page: Page, start_date: date) -> tuple[list[dict],
         print(f"  - Timestamp: {order['order_datetime']}, Amount: ₹{order['bill_total_from_list']}")
     print("--------------------------------------------------------------------")
     print("\n--- PHASE 2: Processing each order for detailed information ---")
-    all_final_summaries, all_final_items = [], []
-    for index, summary_data in enumerate(orders_to_process):
+    order_cache = load_order_cache()
+    uncached_count = sum(1 for order in orders_to_process if _order_cache_key(order) not in order_cache)
+
+    # Orders are independent of each other, so they are processed concurrently in a
+    # small pool of tabs that share the logged-in browser context. The semaphore caps
+    # how many orders are in flight, and each task borrows a tab from the queue so
+    # no two orders ever drive the same page.
+    concurrency = max(1, min(max_concurrency, uncached_count))
+    # A bounded semaphore also fails loudly if it is ever released more often than
+    # acquired, so a bug can never quietly raise the number of open tabs.
+    semaphore = asyncio.BoundedSemaphore(concurrency)
+    page_pool = asyncio.Queue()
+    page_pool.put_nowait(page)
+    extra_pages = [await page.context.new_page() for _ in range(concurrency - 1)]
+    for extra_page in extra_pages:
+        page_pool.put_nowait(extra_page)
+
+    async def process_from_pool(index: int, summary_data: dict):
         order_dt = summary_data['order_datetime']
-        print(f"\n[+] Processing Order {index + 1}/{len(orders_to_process)}: Date='{order_dt.strftime('%Y-%m-%d %H:%M')}'")
-        try:
-            if not page.url == my_orders_url:
-                await page.goto(my_orders_url)
-                await expect(active_my_orders_link).to_be_visible(timeout=20000)
-            amount_str, date_str = summary_data['unique_amount_str'], summary_data['unique_date_str']
-            print(f"  LOG: Searching for an order card containing BOTH '{amount_str}' AND '{date_str}'...")
-            order_card = page.locator('div.tw-flex.tw-flex-col').filter(has_text=re.compile(re.escape(amount_str))).filter(has_text=re.compile(re.escape(date_str))).first
-            scroll_attempts, last_height = 0, await page.evaluate("document.body.scrollHeight")
-            while not await order_card.is_visible() and scroll_attempts < 15:
-                print(f"  LOG: Order not visible yet. Scrolling down (Attempt {scroll_attempts + 1})...")
-                await page.keyboard.press("End")
-                await page.wait_for_timeout(2500)
-                new_height = await page.evaluate("document.body.scrollHeight")
-                if new_height == last_height: break
-                last_height = new_height
-                scroll_attempts += 1
-            if not await order_card.is_visible(): raise Exception(f"Could not find the order card after scrolling.")
-            print("  LOG: Found unique order card. Clicking it now...")
-            await order_card.locator('div.tw-flex-row:has(span.icon-right-arrow)').first.click()
-            intermediate_page_locator = page.get_by_text("View Order Details", exact=True)
-            final_page_locator = page.get_by_text("Bill details", exact=True)
-            await expect(intermediate_page_locator.or_(final_page_locator)).to_be_visible(timeout=20000)
-            if await intermediate_page_locator.is_visible():
-                await intermediate_page_locator.click()
-                await expect(final_page_locator).to_be_visible(timeout=15000)
-            detailed_data = await scrape_order_details(page)
-            final_summary = {**summary_data, **detailed_data["summary"]}
-            if final_summary.get('delivery_time_minutes') == 0 and 'arrival_status' in final_summary:
-                try:
-                    arrival_time_match = re.search(r'(\d{1,2}:\d{2}\s*(?:am|pm))', final_summary['arrival_status'], re.IGNORECASE)
-                    if arrival_time_match:
-                        arrival_datetime = datetime.strptime(f"{summary_data['order_datetime'].date()} {arrival_time_match.group(1)}", "%Y-%m-%d %I:%M %p")
-                        if arrival_datetime < summary_data['order_datetime']: arrival_datetime += timedelta(days=1)
-                        final_summary['delivery_time_minutes'] = round((arrival_datetime - summary_data['order_datetime']).total_seconds() / 60)
-                        print(f"      LOG: Calculated delivery time: {final_summary['delivery_time_minutes']} minutes.")
-                except Exception as e: print(f"      [!] Warning: Failed to calculate delivery time. Error: {e}")
-            all_final_summaries.append(final_summary)
-            order_id = final_summary.get("order_id")
-            for item in detailed_data["items"]:
-                item["order_id"] = order_id
-                all_final_items.append(item)
-        except Exception as e:
-            print(f"  [!] CRITICAL FAILURE for order from {order_dt}: {e}")
-            await page.screenshot(path=f"error_order_{order_dt.strftime('%Y%m%d_%H%M%S')}.png")
-            continue
+        cache_key = _order_cache_key(summary_data)
+        if cache_key in order_cache:
+            print(f"\n[+] Order {index + 1}/{len(orders_to_process)}: Date='{order_dt.strftime('%Y-%m-%d %H:%M')}' was scraped on a previous run. Using cached details.")
+            return order_cache[cache_key]["summary"], order_cache[cache_key]["items"]
+        async with semaphore:
+            worker_page = await page_pool.get()
+            print(f"\n[+] Processing Order {index + 1}/{len(orders_to_process)}: Date='{order_dt.strftime('%Y-%m-%d %H:%M')}'")
+            try:
+                final_summary, items = await _process_order(worker_page, summary_data, my_orders_url)
+                # Only complete, delivered orders are cached, so a partial scrape or an
+                # order still in progress is scraped again on the next run.
+                if is_order_complete(final_summary, items):
+                    order_cache[cache_key] = {"summary": final_summary, "items": items}
+                    newly_cached.append(cache_key)
+                return final_summary, items
+            except Exception as e:
+                log.error("Failed to process the order from %s: %s", order_dt, e)
+                await worker_page.screenshot(path=f"error_order_{order_dt.strftime('%Y%m%d_%H%M%S')}.png")
+                return None
+            finally:
+                page_pool.put_nowait(worker_page)
+
+    # The cache is written once when Phase 2 ends, whether it completes, fails or is
+    # interrupted, instead of re-serialising the whole file on the event loop after
+    # every order.
+    newly_cached = []
+    try:
+        results = await asyncio.gather(*(process_from_pool(index, summary_data) for index, summary_data in enumerate(orders_to_process)))
+    finally:
+        if newly_cached:
+            save_order_cache(order_cache)
+            log.info("Saved %d newly scraped orders to '%s'.", len(newly_cached), ORDER_CACHE_FILE)
+        for extra_page in extra_pages:
+            await extra_page.close()
+
+    all_final_summaries, all_final_items = [], []
+    for result in results:
+        if result is None: continue
+        final_summary, items = result
+        all_final_summaries.append(final_summary)
+        all_final_items.extend(items)
     return all_final_summaries, all_final_items
 
 # ==============================================================================
 # --- DATA EXPORT AND MAIN WORKFLOW ---
 # ==============================================================================
 
+# The columns of each exported sheet, in order, mapped to their header labels.
+SUMMARY_EXPORT_COLUMNS = {
+    'order_id': 'Order ID', 'order_datetime': 'Order Date & Time', 'bill_total': 'Bill Total (₹)',
+    'delivery_time_minutes': 'Delivery Time (Minutes)', 'arrival_status': 'Arrival Status',
+    'total_item_count': 'Total Item Count', 'mrp': 'MRP (₹)', 'product_discount': 'Product Discount (₹)',
+    'item_total': 'Item Sub-Total (₹)', 'handling_charge': 'Handling Charge (₹)',
+    'delivery_charges': 'Delivery Charge (₹)', 'invoice_download_link': 'Invoice Download Link'
+}
+ITEM_EXPORT_COLUMNS = {
+    'order_id': 'Order ID', 'product_name': 'Product Name',
+    'quantity': 'Product Variant / Quantity', 'price': 'Item Price (₹)'
+}
+
+def _write_sheet(workbook: xlsxwriter.Workbook, sheet_name: str, df: pd.DataFrame):
+    """
+    Writes a DataFrame to a new worksheet strictly row by row.
+
+    The workbook is opened in xlsxwriter's constant_memory mode, which flushes each
+    row to disk as soon as the next one is started. pandas' own `to_excel` writes
+    column by column, which that mode does not support, so rows are written here.
+
+    Args:
+        workbook (xlsxwriter.Workbook): The workbook to add the sheet to.
+        sheet_name (str): The name of the new worksheet.
+        df (pd.DataFrame): The data to write, with its columns as the header row.
+    """
+    worksheet = workbook.add_worksheet(sheet_name)
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+    worksheet.write_row(0, 0, df.columns, header_format)
+    for row_index, row in enumerate(df.itertuples(index=False), start=1):
+        worksheet.write_row(row_index, 0, [None if pd.isna(value) else value for value in row])
+
 def export_to_excel(summaries_data: list[dict], items_data: list[dict]):
     """
     Saves the scraped data to a formatted Excel file with two sheets.
@@ -479,37 +1019,29 @@ def export_to_excel(summaries_data: list[dict], items_data: list[dict]):
         print("\nNo data was scraped to export.")
         return
     print("\n--- Processing data for Excel export ---")
-    df_summary = pd.DataFrame(summaries_data)
+    # The frames are built column by column from the known export columns, rather than
+    # making pandas infer a schema from every row dict. Columns no order has are left out.
+    summary_keys = set().union(*summaries_data)
+    df_summary = pd.DataFrame({key: [summary.get(key) for summary in summaries_data]
+                               for key in SUMMARY_EXPORT_COLUMNS if key in summary_keys})
     df_summary.sort_values(by="order_datetime", ascending=False, inplace=True)
     df_summary['order_datetime'] = df_summary['order_datetime'].dt.strftime('%Y-%m-%d %I:%M %p')
-    for col in ['mrp', 'product_discount', 'item_total', 'handling_charge', 'delivery_charges', 'bill_total']:
-        if col in df_summary.columns:
-            df_summary[col] = pd.to_numeric(df_summary[col].astype(str).str.replace(r'[^\d.-]', '', regex=True), errors='coerce').fillna(0)
-    df_summary.rename(columns={
-        'order_id': 'Order ID', 'order_datetime': 'Order Date & Time', 'bill_total': 'Bill Total (₹)',
-        'delivery_time_minutes': 'Delivery Time (Minutes)', 'arrival_status': 'Arrival Status',
-        'total_item_count': 'Total Item Count', 'mrp': 'MRP (₹)', 'product_discount': 'Product Discount (₹)',
-        'item_total': 'Item Sub-Total (₹)', 'handling_charge': 'Handling Charge (₹)',
-        'delivery_charges': 'Delivery Charge (₹)', 'invoice_download_link': 'Invoice Download Link'
-    }, inplace=True)
-    summary_cols = ['Order ID', 'Order Date & Time', 'Bill Total (₹)', 'Delivery Time (Minutes)', 'Arrival Status',
-                    'Total Item Count', 'MRP (₹)', 'Product Discount (₹)', 'Item Sub-Total (₹)',
-                    'Handling Charge (₹)', 'Delivery Charge (₹)', 'Invoice Download Link']
-    df_summary = df_summary[[col for col in summary_cols if col in df_summary.columns]]
-    df_items = pd.DataFrame(items_data)
-    if not df_items.empty:
-        df_items.rename(columns={
-            'order_id': 'Order ID', 'product_name': 'Product Name',
-            'quantity': 'Product Variant / Quantity', 'price': 'Item Price (₹)'
-        }, inplace=True)
-        items_cols = ['Order ID', 'Product Name', 'Product Variant / Quantity', 'Item Price (₹)']
-        df_items = df_items[[col for col in items_cols if col in df_items.columns]]
+    # Bill values are already numeric, but an order whose bill section failed to
+    # scrape has none, so those gaps are filled with 0 as before.
+    bill_cols = [col for col in BILL_FIELD_LABELS if col in df_summary.columns]
+    if bill_cols:
+        df_summary[bill_cols] = df_summary[bill_cols].fillna(0)
+    df_summary.rename(columns=SUMMARY_EXPORT_COLUMNS, inplace=True)
+    item_keys = set().union(*items_data)
+    df_items = pd.DataFrame({key: [item.get(key) for item in items_data]
+                             for key in ITEM_EXPORT_COLUMNS if key in item_keys})
+    df_items.rename(columns=ITEM_EXPORT_COLUMNS, inplace=True)
     output_filename = "blinkit_orders_detailed.xlsx"
     try:
-        with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
-            df_summary.to_excel(writer, sheet_name='Orders Summary', index=False)
+        with xlsxwriter.Workbook(output_filename, {'constant_memory': True}) as workbook:
+            _write_sheet(workbook, 'Orders Summary', df_summary)
             if not df_items.empty:
-                df_items.to_excel(writer, sheet_name='Order Items', index=False)
+                _write_sheet(workbook, 'Order Items', df_items)
         print(f"\n✅ Success! Data for {len(df_summary)} orders saved to '{output_filename}'")
         print(f"   The file contains two sheets: 'Orders Summary' and 'Order Items'.")
     except Exception as e:
@@ -519,50 +1051,59 @@ async def main():
     """
     The main function that orchestrates the entire scraping workflow.
     """
-    AUTH_FILE = "auth.json"
+    configure_logging()
+    PROFILE_DIR = ".blinkit_profile"
     if '--relogin' in sys.argv:
-        print("LOG: '--relogin' flag detected. Forcing a new login.")
-        if os.path.exists(AUTH_FILE):
-            os.remove(AUTH_FILE)
-            print(f"LOG: Removed existing authentication file: '{AUTH_FILE}'")
+        log.info("'--relogin' flag detected. Forcing a new login.")
+        if os.path.exists(PROFILE_DIR):
+            shutil.rmtree(PROFILE_DIR)
+            log.info("Removed existing browser profile: '%s'", PROFILE_DIR)
+    max_concurrency = get_max_concurrency()
     start_date = get_start_date_from_user()
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False, slow_mo=50)
-        context = await browser.new_context(storage_state=AUTH_FILE if os.path.exists(AUTH_FILE) else None)
-        page = await context.new_page()
+        # A persistent on-disk profile keeps the login session (cookies and local
+        # storage) between runs, so repeat runs start from a logged-in browser. Note
+        # that Playwright disables the HTTP cache while any route is registered, so
+        # pages are still loaded cold on every run.
+        # slow_mo delays every single Playwright action, which only helps when watching
+        # the automation step by step, so it is opt-in through BLINKIT_DEBUG.
+        slow_mo = 50 if os.environ.get("BLINKIT_DEBUG") else 0
+        # Phone number and OTP are typed into the terminal, so the window is not needed
+        # to log in; '--headless' skips drawing it. Reduced motion asks the site to skip
+        # its CSS transitions, so modals and lists settle sooner in either mode.
+        headless = '--headless' in sys.argv
+        context = await p.chromium.launch_persistent_context(
+            PROFILE_DIR, headless=headless, slow_mo=slow_mo, reduced_motion="reduce")
+        await context.route(BLOCKED_URL_PATTERN, block_unused_resources)
+        page = context.pages[0] if context.pages else await context.new_page()
+        export_task = None
         try:
             print("\n--- Starting Blinkit Scraper ---")
             await page.goto("https://blinkit.com/", timeout=60000)
-            print("\nLOG: Determining current page state...")
+            log.info("Determining current page state...")
             location_input = page.locator('input[placeholder="search delivery location"]')
+            # After a login the new session is written to the profile by the browser
+            # itself, so there is no session file to save by hand.
             if await location_input.is_visible(timeout=10000):
-                print("LOG: State Detected: Location needs to be set.")
-                if os.path.exists(AUTH_FILE):
-                    os.remove(AUTH_FILE)
+                log.info("State Detected: Location needs to be set.")
                 await set_location_and_login_prep(page)
                 await login_to_blinkit(page)
-                print("LOG: Login successful. Pausing for 3 seconds to ensure session is stable...")
-                await page.wait_for_timeout(3000)
-                print(f"LOG: Saving new session to '{AUTH_FILE}' for future runs...")
-                await context.storage_state(path=AUTH_FILE)
-                print("LOG: Session saved.")
+                log.info("Login successful. The session will be kept in '%s' for future runs.", PROFILE_DIR)
             elif await page.get_by_text("Login", exact=True).is_visible():
-                print("LOG: State Detected: Location is set, but session is expired.")
+                log.info("State Detected: Location is set, but session is expired.")
                 await login_to_blinkit(page)
-                print("LOG: Login successful. Pausing for 3 seconds to ensure session is stable...")
-                await page.wait_for_timeout(3000)
-                print(f"LOG: Overwriting session file '{AUTH_FILE}' with new login data...")
-                await context.storage_state(path=AUTH_FILE)
-                print("LOG: Session saved.")
+                log.info("Login successful. The session will be kept in '%s' for future runs.", PROFILE_DIR)
             elif await page.get_by_text("Account", exact=True).is_visible():
-                print("LOG: State Detected: Fully logged in ('Account' button is visible).")
-                print("LOG: Proceeding directly to scraping.")
-            print("\nLOG: Final check before scraping: Verifying 'Account' button is visible...")
+                log.info("State Detected: Fully logged in ('Account' button is visible).")
+                log.info("Proceeding directly to scraping.")
+            log.info("Final check before scraping: Verifying 'Account' button is visible...")
             await expect(page.get_by_text("Account", exact=True)).to_be_visible(timeout=10000)
-            print("LOG: Verification successful. Proceeding to scrape orders.")
-            all_summaries, all_items = await scrape_orders_since(page, start_date)
+            log.info("Verification successful. Proceeding to scrape orders.")
+            all_summaries, all_items = await scrape_orders_since(page, start_date, max_concurrency)
             if all_summaries:
-                export_to_excel(all_summaries, all_items)
+                # The workbook is written in a worker thread, so the browser can shut
+                # down while the export is still being serialized.
+                export_task = asyncio.create_task(asyncio.to_thread(export_to_excel, all_summaries, all_items))
             else:
                 print(f"\n--- Scraping finished, but no orders were found on or after {start_date.strftime('%Y-%m-%d')}. ---")
         except (TimeoutError, ValueError) as e:
@@ -572,8 +1113,19 @@ async def main():
             print(f"\n❌ An unexpected error occurred: {e}")
             await page.screenshot(path="error.png")
         finally:
-            print("\n--- Workflow Complete. Closing browser. ---")
-            await browser.close()
+            # The export is awaited even if closing the browser fails, so its result is
+            # never lost and the workbook is never left half-written at exit.
+            try:
+                await context.close()
+            finally:
+                if export_task is not None:
+                    await export_task
+                print("\n--- Workflow Complete. Browser closed. ---")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer the libuv-based event loop when it is installed; it lowers the
+    # per-callback overhead of the many small Playwright awaits.
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())